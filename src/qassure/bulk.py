@@ -0,0 +1,184 @@
+"""
+
+Provides the helpers behind the bulk claims of :class:`qassure.framework.ClaimInspector`, which check every element of
+a value in one call instead of one claim per element.
+
+NumPy arrays of numbers are checked with a kernel compiled by Numba when it is installed, or with vectorized NumPy
+operations when it isn't, so Python code only runs again once a deficiency has been found. Neither package is required;
+any other iterable is checked element by element in Python.
+
+"""
+import numbers
+import sys
+import typing as t
+import warnings
+
+
+def _numpy():
+    """ Returns NumPy if something has already imported it, or None. Nothing can be a NumPy array before NumPy is
+        imported, so there is no need to import it here and slow down ``import qassure`` for everyone else.
+    """
+    return sys.modules.get("numpy")
+
+
+def _first_not_equal_kernel(values, target):
+    """ Returns the index of the first element of a 1-D array that is not equal to target, or -1 """
+    for i in range(values.shape[0]):
+        if values[i] != target:
+            return i
+    return -1
+
+
+def _first_out_of_range_kernel(values, low, high):
+    """ Returns the index of the first element of a 1-D array that is not between low and high, or -1 """
+    for i in range(values.shape[0]):
+        if not low <= values[i] <= high:
+            return i
+    return -1
+
+
+# The compiled kernels and the error Numba raises when it can't compile them for some input, or False if Numba isn't
+# installed. Loaded on first use to keep importing this module cheap.
+_kernels = None
+
+# Python ints outside of this range can't be passed to a kernel as an int64
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _load_kernels():
+    """ Compiles the kernels with Numba the first time they are needed, warning once if Numba is not installed.
+
+    :returns: The compiled (first_not_equal, first_out_of_range) kernels and Numba's base error type, or False if Numba
+        is not available
+    :rtype: tuple or bool
+    """
+    global _kernels
+    if _kernels is None:
+        try:
+            import numba
+            from numba.core.errors import NumbaError
+            _kernels = (
+                numba.njit(cache=True)(_first_not_equal_kernel),
+                numba.njit(cache=True)(_first_out_of_range_kernel),
+                NumbaError,
+            )
+        except ImportError:
+            warnings.warn("Numba is not installed, bulk claims on arrays will use NumPy instead")
+            _kernels = False
+    return _kernels
+
+
+def _can_vectorize(np, values, *scalars) -> bool:
+    """ Checks if values is a numeric NumPy array and all the scalars are plain numbers """
+    return (
+        np is not None
+        and isinstance(values, np.ndarray)
+        and values.dtype.kind in "biuf"
+        and all(isinstance(s, numbers.Real) for s in scalars)
+    )
+
+
+def _fits_kernel(np, values, *scalars) -> bool:
+    """ Checks if values and the scalars are types the Numba kernels can be compiled for: arrays of bools, integers,
+        float32 or float64, compared with Python or NumPy bools, int64-sized integers, float32 or float64 numbers.
+    """
+    if values.dtype.kind == "f" and values.dtype.type not in (np.float32, np.float64):
+        return False
+    # Numba compares 64-bit unsigned integers with signed ones as float64, which loses precision above 2 ** 53, so
+    # those comparisons are left to NumPy
+    unsigned_64 = values.dtype.kind == "u" and values.dtype.itemsize == 8
+    for s in scalars:
+        if isinstance(s, np.unsignedinteger) and s.dtype.itemsize == 8 and values.dtype.kind != "u":
+            return False
+        if unsigned_64 and isinstance(s, int) and not isinstance(s, (bool, np.unsignedinteger)):
+            return False
+        if isinstance(s, (np.float32, np.float64, np.bool_, np.integer)):
+            continue
+        if type(s) is float or type(s) is bool:
+            continue
+        if type(s) is int and _INT64_MIN <= s <= _INT64_MAX:
+            continue
+        return False
+    return True
+
+
+def _run_kernel(np, which: int, flat, *scalars) -> t.Optional[int]:
+    """ Runs one of the Numba kernels on the flattened array, returning None if Numba isn't installed, can't handle the
+        inputs or can't compile the kernel for them.
+    """
+    if not _fits_kernel(np, flat, *scalars):
+        return None
+    kernels = _load_kernels()
+    if not kernels:
+        return None
+    try:
+        return kernels[which](flat, *scalars)
+    except kernels[2]:
+        return None
+
+
+def _as_index(np, values, flat_index: int) -> t.Union[int, t.Tuple[int, ...]]:
+    """ Converts an index into the flattened array back into an index into values """
+    if values.ndim == 1:
+        return int(flat_index)
+    return tuple(int(i) for i in np.unravel_index(flat_index, values.shape))
+
+
+def _enumerate(np, values):
+    """ Enumerates values, using full indexes for multi-dimensional NumPy arrays """
+    if np is not None and isinstance(values, np.ndarray) and values.ndim != 1:
+        return np.ndenumerate(values)
+    return enumerate(values)
+
+
+def first_not_equal(values, target) -> t.Optional[t.Union[int, t.Tuple[int, ...]]]:
+    """ Finds the first element that is not equal to a target value.
+
+    :param values: The values to check
+    :type values: iterable
+    :param target: The value every element should be equal to
+    :type target: any
+    :returns: The index of the first element not equal to ``target`` (a tuple for multi-dimensional arrays), or None if
+        they are all equal
+    :rtype: int or tuple
+    """
+    np = _numpy()
+    if _can_vectorize(np, values, target):
+        flat = values.ravel()
+        flat_index = _run_kernel(np, 0, flat, target)
+        if flat_index is None:
+            bad = np.flatnonzero(flat != target)
+            flat_index = bad[0] if bad.size else -1
+        return None if flat_index == -1 else _as_index(np, values, flat_index)
+    for index, value in _enumerate(np, values):
+        if not value == target:
+            return index
+    return None
+
+
+def first_out_of_range(values, low, high) -> t.Optional[t.Union[int, t.Tuple[int, ...]]]:
+    """ Finds the first element that is not between two values, inclusively.
+
+    :param values: The values to check
+    :type values: iterable
+    :param low: The lowest allowed value
+    :type low: any
+    :param high: The highest allowed value
+    :type high: any
+    :returns: The index of the first element outside of the range (a tuple for multi-dimensional arrays), or None if
+        they are all within it
+    :rtype: int or tuple
+    """
+    np = _numpy()
+    if _can_vectorize(np, values, low, high):
+        flat = values.ravel()
+        flat_index = _run_kernel(np, 1, flat, low, high)
+        if flat_index is None:
+            bad = np.flatnonzero(~((flat >= low) & (flat <= high)))
+            flat_index = bad[0] if bad.size else -1
+        return None if flat_index == -1 else _as_index(np, values, flat_index)
+    for index, value in _enumerate(np, values):
+        if not low <= value <= high:
+            return index
+    return None
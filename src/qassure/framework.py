@@ -10,10 +10,16 @@ will be reported.
 
 """
 import enum
+import functools
+import linecache
+import re
+import sys
 import typing as t
 import traceback
 import abc
 
+from . import bulk
+
 
 class Severity(enum.IntEnum):
     """ The severity of a deficiency """
@@ -39,23 +45,84 @@ class BlockingDeficiencyError(Exception):
     pass
 
 
+class ReportItem(t.NamedTuple):
+    """ A single entry in an audit report. As a named tuple, it can still be unpacked or indexed like a plain tuple. """
+
+    severity: Severity
+    """ The severity of the deficiency """
+
+    message: str
+    """ The message describing the deficiency """
+
+    source: str
+    """ Where the deficiency was reported from """
+
+
 class AuditReport:
-    """ Manages the audit report, which is a list of tuples. Wraps the list but changes ``append()`` to work better for
-        this purpose.
+    """ Manages the audit report, which is a list of :class:`qassure.framework.ReportItem` tuples. Wraps the list but
+        changes ``append()`` to work better for this purpose.
+
+        Sources given as frames are kept as-is until the report is read, so audits whose report is never inspected
+        never pay for formatting them. Identical items share a single :class:`qassure.framework.ReportItem`, so a
+        deficiency repeated across many records only costs one list entry per repeat.
      """
 
+    __slots__ = ("_items", "_pending", "_max_severity", "_unique", "_snapshot")
+
     def __init__(self):
         """ Constructor"""
-        self.report_items = []
+        self._items = []
+        self._pending = []
+        self._max_severity = 0
+        self._unique = {}
+        self._snapshot = ()
+
+    @property
+    def report_items(self) -> t.Tuple[ReportItem, ...]:
+        """ The items in the report as a tuple, formatting any that were appended since the report was last read. The
+            report only changes through ``append()``, ``clear()`` or assigning a list of ``(severity, message, source)``
+            tuples here to replace its contents, so that ``max_severity`` and ``unique_items()`` stay accurate.
+        """
+        if self._pending:
+            self._format_pending()
+        if len(self._snapshot) != len(self._items):
+            self._snapshot = tuple(self._items)
+        return self._snapshot
+
+    @report_items.setter
+    def report_items(self, items: t.Iterable[t.Tuple[Severity, str, str]]):
+        items = list(items)
+        self.clear()
+        for severity, message, source in items:
+            self.append(severity, message, source)
+
+    @property
+    def max_severity(self):
+        """ The highest severity appended to the report so far as a plain int, or 0 if the report is empty """
+        return self._max_severity
+
+    def unique_items(self) -> t.List[t.Tuple[ReportItem, int]]:
+        """ Lists each distinct item in the report once, in the order they were first appended.
+
+        :returns: Pairs of each distinct item and the number of times it appears in the report
+        :rtype: list
+        """
+        if self._pending:
+            self._format_pending()
+        return [(item, count) for item, count in self._unique.values()]
 
     def __len__(self):
-        return len(self.report_items)
+        return len(self._items) + len(self._pending)
 
     def __getitem__(self, k):
-        return self.report_items[k]
+        if self._pending:
+            self._format_pending()
+        return self._items[k]
 
     def __iter__(self):
-        return iter(self.report_items)
+        if self._pending:
+            self._format_pending()
+        return iter(self._items)
 
     def append(self, severity, message, source):
         """ Appends a report to the report list
@@ -64,10 +131,97 @@ class AuditReport:
         :type severity: qassure.framework.Severity
         :param message: The message related to the error
         :type message: str
-        :param source: The source of the error
-        :type source: str
+        :param source: The source of the error, either already formatted or the frame it was raised from
+        :type source: str or traceback.FrameSummary
         """
-        self.report_items.append((severity, message, source))
+        self._pending.append((severity, message, source))
+        if severity > self._max_severity:
+            self._max_severity = int(severity)
+
+    def clear(self):
+        """ Removes every item from the report """
+        self._items.clear()
+        self._pending.clear()
+        self._unique.clear()
+        self._max_severity = 0
+        self._snapshot = ()
+
+    def _format_pending(self):
+        """ Moves the pending entries into the report items, formatting any frames into source strings and reusing the
+            existing item when an identical one was seen before.
+        """
+        for severity, message, source in self._pending:
+            if not isinstance(source, str):
+                source = "File \"{}\", line {}, in {}: {}".format(
+                    source.filename,
+                    source.lineno,
+                    source.name,
+                    source.line
+                )
+            item = ReportItem(severity, message, source)
+            try:
+                entry = self._unique.get(item)
+            except TypeError:
+                # Messages don't have to be strings, and items holding an unhashable one can't be shared
+                entry = self._unique[object()] = [item, 0]
+            else:
+                if entry is None:
+                    entry = self._unique[item] = [item, 0]
+            entry[1] += 1
+            self._items.append(entry[0])
+        self._pending.clear()
+
+
+# Tokens that matter when looking for the end of the first argument of a call. String literals are matched whole so that
+# any delimiters inside them are ignored.
+_ARG_TOKENS = re.compile(r"""
+    (?P<string>"(?:\\.|[^"\\])*"?|'(?:\\.|[^'\\])*'?)
+    |(?P<open>[(\[{])
+    |(?P<close>[)\]}])
+    |(?P<separator>,)
+""", re.VERBOSE)
+
+# Remembers whether a frame name belongs to the framework, keyed by owner and then by co_name
+_SKIP_DECISIONS = {}
+
+
+def _find_source_frame(owner: type, previous: traceback.FrameSummary = None) -> t.Optional[traceback.FrameSummary]:
+    """ Walks up the call stack and summarizes the first frame that is not running one of ``owner``'s methods.
+
+        The walk starts above the caller, which is always one of ``owner``'s own methods, and only the chosen frame is
+        summarized, so the rest of the stack is never formatted. Whether a name is skipped is decided once per distinct
+        name and remembered in ``_SKIP_DECISIONS``.
+
+    :param owner: The class whose methods should be skipped
+    :type owner: type
+    :param previous: Optional. A summary found by an earlier walk, returned again if the chosen frame is at the same
+        place so that its source line is only read once
+    :type previous: traceback.FrameSummary
+    :returns: A summary of the most relevant frame, or None if every frame was skipped
+    :rtype: traceback.FrameSummary
+    """
+    decisions = _SKIP_DECISIONS.get(owner)
+    if decisions is None:
+        decisions = _SKIP_DECISIONS[owner] = {}
+    frame = sys._getframe(2)
+    while frame is not None:
+        name = frame.f_code.co_name
+        skip = decisions.get(name)
+        if skip is None:
+            skip = decisions[name] = name in owner._internal_names
+        if skip:
+            frame = frame.f_back
+            continue
+        code = frame.f_code
+        if (previous is not None and previous.lineno == frame.f_lineno and previous.name == name
+                and previous.filename == code.co_filename):
+            return previous
+        # The source line is only read from linecache if and when someone accesses it. Modules loaded by an import
+        # loader (zip files, eggs) can only be read through their loader, which has to be registered while the frame
+        # is still alive, as extract_stack() does. This does no I/O.
+        linecache.lazycache(frame.f_code.co_filename, frame.f_globals)
+        return traceback.FrameSummary(frame.f_code.co_filename, frame.f_lineno, name, lookup_line=False)
+    return None     # pragma: no cover
 
 
 class Auditor(abc.ABC):
@@ -101,8 +255,12 @@ class Auditor(abc.ABC):
             # Passes
             auditor = AuditDateFormatDict({"date": None, "format": None})
 
+        This class declares ``__slots__``. Sub-classes that don't declare their own still get a ``__dict__`` as usual,
+        so they can set any attributes they like; declaring ``__slots__`` on them as well keeps instances compact.
     """
 
+    __slots__ = ("report", "qa_run_flag", "is_blocked")
+
     def __init__(self):
         """ Constructor """
         self.report = AuditReport()
@@ -126,10 +284,8 @@ class Auditor(abc.ABC):
             :returns: Whether any errors with severity greater than ``max_level`` were encountered.
             :rtype: bool
         """
-        for m in self.report:
-            if m[0] > max_level:
-                return False
-        return True
+        self.run_audit()
+        return self.report.max_severity <= max_level
 
     def add_report_item(self, severity: Severity, message: str, last_frame: traceback.FrameSummary = None):
         """ Adds an item to the report. Mostly intended to be used from ``qassure.framework.ValueInspector`` to report
@@ -143,15 +299,7 @@ class Auditor(abc.ABC):
             raised
         :type last_frame: traceback.FrameSummary
         """
-        source = "Unknown"
-        if last_frame:
-            source = "File \"{}\", line {}, in {}: {}".format(
-                last_frame.filename,
-                last_frame.lineno,
-                last_frame.name,
-                last_frame.line
-            )
-        self.report.append(severity, message, source)
+        self.report.append(severity, message, last_frame if last_frame else "Unknown")
 
     def claim(self, value, severity: Severity = Severity.ERROR, object_name=None):
         """ Retrieves a ValueInspector object that can be used to make claims about a value::
@@ -164,43 +312,37 @@ class Auditor(abc.ABC):
         :return: A class to use for making claims about the value.
         :rtype: qassure.framework.ClaimInspector
         """
+        name_frame = None
         if object_name is None:
-            object_name = "[provided value]"
-            stack = traceback.extract_stack()
-            stack.reverse()
-            for frame in stack:
-                if hasattr(Auditor, frame.name):
-                    continue
-                test_object_name = self._parse_frame_line_for_arg(frame.line)
-                if test_object_name:
-                    object_name = "[{}]".format(test_object_name)
-                break
-        return ClaimInspector(self, severity, value, object_name)
-
-    def _parse_frame_line_for_arg(self, line):
-        """ Helper method to extract the first argument from a method call on a Python line from a stack trace."""
+            # The caller's frame is gone once we return, so it is found now, but its line is only read and parsed if
+            # the inspector's object_name is ever needed.
+            name_frame = _find_source_frame(Auditor)
+        return ClaimInspector(self, severity, value, object_name, name_frame)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_frame_line_for_arg(line):
+        """ Helper method to extract the first argument from a method call on a Python line from a stack trace. Results
+            are cached by line, since audits tend to make claims from the same lines over and over.
+        """
+        start_at = line.find("(")
         # No method call is on the line
-        if "(" not in line:
+        if start_at == -1:
             return None     # pragma: no cover
-        start_at = line.find("(") + 1
-        stack = [")"]
-        buffer = ""
-        escaped = False
-        for i in range(start_at, len(line)):
-            char = line[i]
-            if not escaped:
-                if char == stack[-1]:
-                    stack = stack[:-1]
-                    if not stack:
-                        break
-                elif char == "\"":
-                    stack.append(char)
-                elif char == "(":
-                    stack.append(")")
-            if char == "," and len(stack) == 1:
-                return buffer
-            buffer += char
-        return buffer
+        start_at += 1
+        depth = 0
+        # Only string literals and delimiters are visited, the regex skips over everything else
+        for match in _ARG_TOKENS.finditer(line, start_at):
+            kind = match.lastgroup
+            if kind == "open":
+                depth += 1
+            elif kind == "close":
+                if depth == 0:
+                    return line[start_at:match.start()]
+                depth -= 1
+            elif kind == "separator" and depth == 0:
+                return line[start_at:match.start()]
+        return line[start_at:]
 
     def run_audit(self):
         """ Runs the audit if it hasn't already been run.
@@ -209,6 +351,7 @@ class Auditor(abc.ABC):
             :class:`qassure.framework.BlockingDeficiencyError` when appropriate so that the audit ends gracefully.
         """
         if not self.qa_run_flag:
+            self.qa_run_flag = True
             try:
                 self.audit()
             except BlockingDeficiencyError:
@@ -231,14 +374,40 @@ class ClaimInspector:
         :type value: any
         :param object_name: A useful value to show in error messages, defaults to [provided value]
         :type object_name: str
+        :param name_frame: Optional. If no ``object_name`` is given, the frame whose source line the name is parsed from
+            when it is first needed
+        :type name_frame: traceback.FrameSummary
     """
 
-    def __init__(self, agent: Auditor, error_level: Severity, value: t.Any, object_name=None):
+    # One inspector is created for every claim, so keep them small
+    __slots__ = ("agent", "error_level", "value", "_object_name", "_name_frame", "_last_frame")
+
+    def __init__(self, agent: Auditor, error_level: Severity, value: t.Any, object_name=None,
+                 name_frame: traceback.FrameSummary = None):
         """ Constructor """
         self.agent = agent
         self.error_level = error_level
         self.value = value
-        self.object_name = object_name if object_name else "[provided value]"
+        self._object_name = object_name or None
+        self._name_frame = name_frame
+        self._last_frame = None
+
+    @property
+    def object_name(self) -> str:
+        """ The name of the value in error messages. When it wasn't given, it is parsed from the line the claim was made
+            on the first time it is needed, so claims that pass never pay for it.
+        """
+        if self._object_name is None:
+            self._object_name = "[provided value]"
+            if self._name_frame is not None:
+                test_object_name = self.agent._parse_frame_line_for_arg(self._name_frame.line)
+                if test_object_name:
+                    self._object_name = f"[{test_object_name}]"
+        return self._object_name
+
+    @object_name.setter
+    def object_name(self, object_name: str):
+        self._object_name = object_name
 
     def _report_deficiency(self, msg):
         """ Reports a deficiency to the audit report
@@ -247,16 +416,10 @@ class ClaimInspector:
         :type msg: str
         :raises qassure.framework.BlockingDeficiencyError: If the severity was set to ``BLOCKER``.
         """
-        stack = traceback.extract_stack()
-        stack.reverse()
-        last_frame = None
-        for frame in stack:
-            # Skip the internal stuff within ValueInspector
-            if hasattr(ClaimInspector, frame.name) or frame.name.startswith("__"):
-                continue     # pragma: no cover
-            last_frame = frame
-            break
-        self.agent.add_report_item(self.error_level, msg, last_frame)
+        # Claims chained on one inspector usually come from the same place, in which case every deficiency shares a
+        # single summary. Passing claims never walk the stack. Skip the internal stuff within ClaimInspector.
+        self._last_frame = _find_source_frame(ClaimInspector, self._last_frame)
+        self.agent.add_report_item(self.error_level, msg, self._last_frame)
         if self.error_level == Severity.BLOCKER:
             raise BlockingDeficiencyError()
 
@@ -266,9 +429,9 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if not self.value:
-            msg = msg or "{} is not truthy, should be".format(self.object_name)
-            self._report_deficiency(msg)
+        if self.value:
+            return self
+        self._report_deficiency(msg or f"{self.object_name} is not truthy, should be")
         return self
 
     def is_none(self, msg=None):
@@ -277,9 +440,9 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if self.value is not None:
-            msg = msg or "{} is not none, should be".format(self.object_name)
-            self._report_deficiency(msg)
+        if self.value is None:
+            return self
+        self._report_deficiency(msg or f"{self.object_name} is not none, should be")
         return self
 
     def is_not_none(self, msg=None):
@@ -288,9 +451,9 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if self.value is None:
-            msg = msg or "{} is None, should not be".format(self.object_name)
-            self._report_deficiency(msg)
+        if self.value is not None:
+            return self
+        self._report_deficiency(msg or f"{self.object_name} is None, should not be")
         return self
 
     def is_type(self, cls: type, msg=None):
@@ -301,9 +464,9 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if not isinstance(self.value, cls):
-            msg = msg or "{} is not an instance of {}".format(self.object_name, cls)
-            self._report_deficiency(msg)
+        if isinstance(self.value, cls):
+            return self
+        self._report_deficiency(msg or f"{self.object_name} is not an instance of {cls}")
         return self
 
     def is_callable(self, msg=None):
@@ -312,9 +475,9 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if not callable(self.value):
-            msg = msg or "{} is not callable".format(self.object_name)
-            self._report_deficiency(msg)
+        if callable(self.value):
+            return self
+        self._report_deficiency(msg or f"{self.object_name} is not callable")
         return self
 
     def is_equal_to(self, value, msg=None):
@@ -325,15 +488,15 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if not self.value == value:
-            msg = msg or "{} is not equal to {}".format(self.object_name, value)
-            self._report_deficiency(msg)
+        if self.value == value:
+            return self
+        self._report_deficiency(msg or f"{self.object_name} is not equal to {value}")
         return self
 
     def if_not_none(self):
         """ Only continue checking claims if the value is not None """
         if self.value is None:
-            return NoOpInspector()
+            return _NOOP_INSPECTOR
         return self
 
     def if_is_type(self, cls: type):
@@ -343,7 +506,7 @@ class ClaimInspector:
         :type cls: type
         """
         if not isinstance(self.value, cls):
-            return NoOpInspector()
+            return _NOOP_INSPECTOR
         return self
 
     def contains(self, value, msg=None):
@@ -354,9 +517,45 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        if value not in self.value:
-            msg = msg or "{} does not contain value {}".format(self.object_name, value)
-            self._report_deficiency(msg)
+        if value in self.value:
+            return self
+        self._report_deficiency(msg or f"{self.object_name} does not contain value {value}")
+        return self
+
+    def all_equal_to(self, value, msg=None):
+        """ Checks that every element of the value is equal to another value. NumPy arrays are checked in bulk, see
+            :mod:`qassure.bulk`.
+
+        :param value: The value every element should be equal to
+        :type value: any
+        :param msg: The message to set if the claim is false, or None to use the default
+        :type msg: str
+        """
+        index = bulk.first_not_equal(self.value, value)
+        if index is None:
+            return self
+        self._report_deficiency(
+            msg or f"{self.object_name} has an element at index {index} that is not equal to {value}"
+        )
+        return self
+
+    def all_in_range(self, low, high, msg=None):
+        """ Checks that every element of the value is between two values, inclusively. NumPy arrays are checked in bulk,
+            see :mod:`qassure.bulk`.
+
+        :param low: The lowest allowed value
+        :type low: any
+        :param high: The highest allowed value
+        :type high: any
+        :param msg: The message to set if the claim is false, or None to use the default
+        :type msg: str
+        """
+        index = bulk.first_out_of_range(self.value, low, high)
+        if index is None:
+            return self
+        self._report_deficiency(
+            msg or f"{self.object_name} has an element at index {index} that is not between {low} and {high}"
+        )
         return self
 
     def raises(self, exception_type: type, *args, msg=None, **kwargs):
@@ -367,18 +566,23 @@ class ClaimInspector:
         :param msg: The message to set if the claim is false, or None to use the default
         :type msg: str
         """
-        msg = msg or "{} does not raise exception {}".format(self.object_name, exception_type)
         try:
             self.value(*args, **kwargs)
-            self._report_deficiency(msg)
-        except exception_type as ex:
-            pass
+        except exception_type:
+            return self
+        self._report_deficiency(msg or f"{self.object_name} does not raise exception {exception_type}")
         return self
 
 
 class NoOpInspector:
     """ For use with the ``if_*()`` methods, this is a version of :class:`qassure.framework.ClaimInspector` that doesn't
-        report any errors ever. Returned if an ``if_*()`` method is not true. """
+        report any errors ever. Returned if an ``if_*()`` method is not true.
+
+        Every method of :class:`qassure.framework.ClaimInspector` is defined on this class as a real method that returns
+        the inspector, so skipped claim chains use plain method calls. ``__getattr__()`` only handles anything else.
+    """
+
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -388,3 +592,24 @@ class NoOpInspector:
 
     def __call__(self, *args, **kwargs):
         return self
+
+
+def _no_op_method(self, *args, **kwargs):
+    """ Stands in for a :class:`qassure.framework.ClaimInspector` method on :class:`qassure.framework.NoOpInspector` """
+    return self
+
+
+for _name, _member in vars(ClaimInspector).items():
+    if callable(_member) and not _name.startswith("__"):
+        setattr(NoOpInspector, _name, _no_op_method)
+del _name, _member
+
+# NoOpInspector holds no state, so the if_*() methods can all share one instance
+_NOOP_INSPECTOR = NoOpInspector()
+
+
+# Names that identify the framework's own frames when walking the stack, computed once instead of using hasattr().
+# Double underscore names are left out, since every class has them: a claim made from a sub-class's constructor should
+# be traced to that constructor, not to whoever called it, both for its object name and for its source.
+Auditor._internal_names = frozenset(name for name in dir(Auditor) if not name.startswith("__"))
+ClaimInspector._internal_names = frozenset(name for name in dir(ClaimInspector) if not name.startswith("__"))
@@ -0,0 +1,42 @@
+import traceback
+from qassure import Severity
+
+
+class AddReportItemTests:
+    """ Tests for ``Auditor.add_report_item()``, mixed into a ``unittest.TestCase`` that sets ``agent_factory`` to a
+        callable returning a fresh auditor which hasn't been run yet.
+    """
+
+    agent_factory = None
+
+    def test_add_report_item(self):
+        agent = self.agent_factory()
+        self.assertEqual(len(agent.report), 0)
+        agent.add_report_item(
+            Severity.BLOCKER,
+            "test message",
+            None
+        )
+        self.assertEqual(len(agent.report), 1)
+        self.assertEqual(agent.report[0][0], Severity.BLOCKER)
+        self.assertEqual(agent.report[0][1], "test message")
+        self.assertEqual(agent.report[0][2], "Unknown")
+        agent.add_report_item(
+            Severity.CRITICAL,
+            "test message2",
+            None
+        )
+        self.assertEqual(len(agent.report), 2)
+        self.assertEqual(agent.report[0][0], Severity.BLOCKER)
+        self.assertEqual(agent.report[0][1], "test message")
+        self.assertEqual(agent.report[0][2], "Unknown")
+        self.assertEqual(agent.report[1][0], Severity.CRITICAL)
+        self.assertEqual(agent.report[1][1], "test message2")
+        self.assertEqual(agent.report[1][2], "Unknown")
+
+    def test_add_report_item_with_frame(self):
+        agent = self.agent_factory()
+        frame = traceback.FrameSummary("example.py", 12, "audit", line="self.claim(x).is_truthy()")
+        agent.add_report_item(Severity.ERROR, "test message", frame)
+        self.assertEqual(len(agent.report), 1)
+        self.assertEqual(agent.report[0].source, 'File "example.py", line 12, in audit: self.claim(x).is_truthy()')
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from qassure import Auditor, Severity
 
 
@@ -44,3 +45,25 @@ class AuditorWithWarning(Auditor):
         self.claim(1, Severity.CRITICAL).is_truthy()
         self.claim(1, Severity.ERROR).is_truthy()
         self.claim(1, Severity.BLOCKER).is_truthy()
+
+
+@lru_cache(maxsize=None)
+def get_no_failures_report():
+    """ Runs AuditorNoFailures once and shares the auditor and its report; tests must not modify them """
+    audit = AuditorNoFailures()
+    return audit, audit.get_report()
+
+
+@lru_cache(maxsize=None)
+def get_with_warning_report():
+    """ Runs AuditorWithWarning once and shares the auditor and its report; tests must not modify them """
+    audit = AuditorWithWarning()
+    return audit, audit.get_report()
+
+
+class AuditorWithRepeats(Auditor):
+
+    def audit(self):
+        for value in (0, 1, 0, 0):
+            self.claim(value, Severity.WARNING, "[value]").is_truthy()
+        self.claim(None, Severity.ERROR, "[value]").is_not_none()
@@ -1,13 +1,15 @@
 import unittest
 import tests.helpers as helpers
 from qassure import Severity
+from tests._shared import AddReportItemTests
 
 
-class TestAudit(unittest.TestCase):
+class TestAudit(AddReportItemTests, unittest.TestCase):
+
+    agent_factory = staticmethod(helpers.AuditorNoFailures)
 
     def test_report(self):
-        audit = helpers.AuditorNoFailures()
-        report = audit.get_report()
+        audit, report = helpers.get_no_failures_report()
         self.assertFalse(audit.is_blocked)
         self.assertEqual(len(report.report_items), 0)
         item = sum([1 for item in report])
@@ -18,8 +20,7 @@ class TestAudit(unittest.TestCase):
         self.assertTrue(audit.passed(Severity.CRITICAL))
 
     def test_report_with_warning(self):
-        audit = helpers.AuditorWithWarning()
-        report = audit.get_report()
+        audit, report = helpers.get_with_warning_report()
         self.assertFalse(audit.is_blocked)
         self.assertEqual(len(report.report_items), 1)
         item = sum([1 for item in report])
@@ -29,5 +30,77 @@ class TestAudit(unittest.TestCase):
         self.assertTrue(audit.passed(Severity.ERROR))
         self.assertTrue(audit.passed(Severity.CRITICAL))
 
+    def test_audit_runs_once(self):
+        audit = helpers.AuditorWithWarning()
+        self.assertFalse(audit.passed(Severity.INFO))
+        self.assertEqual(len(audit.get_report()), 1)
+        self.assertEqual(len(audit.get_report()), 1)
+        self.assertEqual(audit.get_report().max_severity, Severity.WARNING)
+        self.assertIs(type(audit.get_report().max_severity), int)
+
+    def test_report_items_read_only(self):
+        audit = helpers.BaseAuditor()
+        audit.claim(0).is_truthy()
+        report = audit.get_report()
+        with self.assertRaises(AttributeError):
+            report.report_items.clear()
+        self.assertEqual(len(report), 1)
+        self.assertFalse(audit.passed())
+        self.assertEqual(len(report.unique_items()), 1)
+        report.clear()
+        report.append(Severity.WARNING, "two", "Unknown")
+        self.assertEqual([item.message for item in report.report_items], ["two"])
 
+    def test_report_unhashable_message(self):
+        audit = helpers.BaseAuditor()
+        audit.claim(0).is_truthy(["detail"])
+        audit.claim(0).is_truthy(["detail"])
+        report = audit.get_report()
+        self.assertEqual(len(report.report_items), 2)
+        self.assertEqual(report[0].message, ["detail"])
+        self.assertEqual([count for item, count in report.unique_items()], [1, 1])
 
+    def test_report_clear(self):
+        audit = helpers.AuditorWithWarning()
+        report = audit.get_report()
+        report.clear()
+        self.assertEqual(len(report), 0)
+        self.assertEqual(report.max_severity, 0)
+        self.assertEqual(report.unique_items(), [])
+        self.assertTrue(audit.passed(Severity.INFO))
+
+    def test_report_items_assignment(self):
+        audit = helpers.AuditorWithWarning()
+        report = audit.get_report()
+        report.report_items = [(Severity.ERROR, "one", "Unknown"), (Severity.ERROR, "one", "Unknown")]
+        self.assertEqual(len(report), 2)
+        self.assertEqual(report[0].message, "one")
+        self.assertEqual(report.max_severity, Severity.ERROR)
+        self.assertEqual(report.unique_items(), [(report[0], 2)])
+        report.report_items = []
+        self.assertEqual(len(report), 0)
+        self.assertTrue(audit.passed(Severity.INFO))
+
+    def test_report_item_fields(self):
+        audit, report = helpers.get_with_warning_report()
+        item = report[0]
+        self.assertEqual(item.severity, Severity.WARNING)
+        self.assertEqual(item.message, item[1])
+        self.assertEqual(item.source, item[2])
+        severity, message, source = item
+        self.assertEqual(severity, Severity.WARNING)
+        self.assertIn("audit", source)
+
+    def test_report_unique_items(self):
+        audit = helpers.AuditorWithRepeats()
+        report = audit.get_report()
+        self.assertEqual(len(report), 4)
+        self.assertEqual([item.severity for item in report], [Severity.WARNING] * 3 + [Severity.ERROR])
+        self.assertIs(report[0], report[1])
+        self.assertIs(report[0], report[2])
+        unique = report.unique_items()
+        self.assertEqual(len(unique), 2)
+        self.assertIs(unique[0][0], report[0])
+        self.assertEqual(unique[0][1], 3)
+        self.assertIs(unique[1][0], report[3])
+        self.assertEqual(unique[1][1], 1)
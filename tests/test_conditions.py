@@ -1,35 +1,120 @@
+import fractions
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+import zipfile
 import qassure
 import qassure.framework
 import tests.helpers as helpers
+from tests._shared import AddReportItemTests
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-class TestAgent(unittest.TestCase):
 
-    def test_add_report_item(self):
-        agent = helpers.BaseAuditor()
-        self.assertEqual(len(agent.report), 0)
-        agent.add_report_item(
-            qassure.Severity.BLOCKER,
-            "test message",
-            None
-        )
-        self.assertEqual(len(agent.report), 1)
-        self.assertEqual(agent.report[0][0], qassure.Severity.BLOCKER)
-        self.assertEqual(agent.report[0][1], "test message")
-        self.assertEqual(agent.report[0][2], "Unknown")
-        agent.add_report_item(
-            qassure.Severity.CRITICAL,
-            "test message2",
-            None
-        )
-        self.assertEqual(len(agent.report), 2)
-        self.assertEqual(agent.report[0][0], qassure.Severity.BLOCKER)
-        self.assertEqual(agent.report[0][1], "test message")
-        self.assertEqual(agent.report[0][2], "Unknown")
-        self.assertEqual(agent.report[1][0], qassure.Severity.CRITICAL)
-        self.assertEqual(agent.report[1][1], "test message2")
-        self.assertEqual(agent.report[1][2], "Unknown")
+# Shared inputs for the case tables below, built once per process. Tests must not mutate them.
+_LIST_FIXTURE = ["a", "b", 4]
+_SET_FIXTURE = {"a", "b"}
+_DICT_FIXTURE = {"a": "c", "b": "d"}
+_TUPLE_FIXTURE = ("a",)
+
+# (value, whether the claim should report a deficiency)
+IS_NONE_CASES = (
+    (None, False),
+    ("", True),
+    (0, True),
+    (5, True),
+    (False, True),
+    (True, True),
+)
+
+IS_NOT_NONE_CASES = (
+    ("foo", False),
+    ("", False),
+    (0, False),
+    (5, False),
+    (False, False),
+    (True, False),
+)
+
+IS_TRUTHY_CASES = (
+    (True, False),
+    (False, True),
+    (5, False),
+    (0, True),
+    (-5, False),
+    (1, False),
+    (-1, False),
+    ("abcde", False),
+    (range(0), True),
+    (range(0, 5), False),
+    ("", True),
+    (None, True),
+    (0.0, True),
+    (0.0j, True),
+    ([], True),
+    ({}, True),
+    (tuple(), True),
+    ([0], False),
+    (["0"], False),
+    (["False"], False),
+    (["abcd"], False),
+    (["None"], False),
+    ([False], False),
+    ([None], False),
+    ({0}, False),
+    ({False}, False),
+    ({None}, False),
+    ((0,), False),
+    ((False,), False),
+    ((None,), False),
+    ({"a", "c", "d"}, False),
+    ({"0": False}, False),
+    ({"a": "a", "c": "b", "d": "f"}, False),
+    ((1, 2, 3), False),
+    (helpers.TruthyClass(False), True),
+    (helpers.TruthyClass(True), False),
+)
+
+IS_CALLABLE_CASES = (
+    (unittest.TestCase, False),
+    (unittest.TestCase.assertEqual, False),
+    (helpers.function_example, False),
+    (lambda: "hello world", False),
+    ("hello world", True),
+    (5, True),
+    (False, True),
+    (None, True),
+    (2.32, True),
+    (helpers.TruthyClass, False),
+    (helpers.TruthyClass("huh"), True),
+    (helpers.CallableClass(), False),
+)
+
+# (value, type, whether the claim should report a deficiency)
+IS_TYPE_CASES = (
+    ("five", str, False),
+    (5, int, False),
+    (True, bool, False),
+    (4.3, float, False),
+    ([], list, False),
+    (_LIST_FIXTURE, list, False),
+    (_SET_FIXTURE, set, False),
+    (_DICT_FIXTURE, dict, False),
+    (_TUPLE_FIXTURE, tuple, False),
+    ("5", int, True),
+    (0, bool, True),
+)
+
+
+class TestAgent(AddReportItemTests, unittest.TestCase):
+
+    agent_factory = staticmethod(helpers.BaseAuditor)
 
     def test_blocking_failure(self):
         class AuditorForTesting(qassure.Auditor):
@@ -75,12 +160,65 @@ class TestAgent(unittest.TestCase):
         inspector = agent.claim(self.value())
         self.assertTrue(inspector.value)
         self.assertEqual(inspector.object_name, '[self.value()]')
+        inspector.object_name = "[renamed]"
+        self.assertEqual(inspector.object_name, "[renamed]")
+
+    def test_inspector_object_name_in_constructor(self):
+        class AuditorForTesting(qassure.Auditor):
+            def __init__(self, test_value):
+                super().__init__()
+                self.inspector = self.claim(test_value)
+                self.claim(test_value).is_truthy()
+
+            def audit(self):
+                pass
+        obj = AuditorForTesting(0)
+        self.assertEqual(obj.inspector.object_name, "[test_value]")
+        self.assertEqual(obj.report[0].message, "[test_value] is not truthy, should be")
+        self.assertTrue(obj.report[0].source.endswith("in __init__: self.claim(test_value).is_truthy()"))
+
+    def test_zipimported_claim_source(self):
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, "zipped_audit.zip")
+            with zipfile.ZipFile(archive, "w") as handle:
+                handle.writestr("zipped_audit.py", "def run(agent, value):\n    agent.claim(value).is_truthy()\n")
+            sys.path.insert(0, archive)
+            try:
+                module = importlib.import_module("zipped_audit")
+            finally:
+                sys.path.remove(archive)
+                sys.modules.pop("zipped_audit", None)
+            agent = helpers.BaseAuditor()
+            module.run(agent, 0)
+        self.assertEqual(agent.report[0].message, "[value] is not truthy, should be")
+        self.assertTrue(agent.report[0].source.endswith("in run: agent.claim(value).is_truthy()"))
+
+    def test_inspector_object_name_delimiters(self):
+        agent = helpers.BaseAuditor()
+        inspector = agent.claim("a, (b", qassure.Severity.WARNING)
+        self.assertEqual(inspector.object_name, '["a, (b"]')
+        inspector = agent.claim('a)', qassure.Severity.WARNING)
+        self.assertEqual(inspector.object_name, "['a)']")
+        inspector = agent.claim([1, 2], qassure.Severity.WARNING)
+        self.assertEqual(inspector.object_name, '[[1, 2]]')
+        inspector = agent.claim({"a": (1, 2)}.get("a"), qassure.Severity.WARNING)
+        self.assertEqual(inspector.object_name, '[{"a": (1, 2)}.get("a")]')
+        inspector = agent.claim("a\", (b", qassure.Severity.WARNING)
+        self.assertEqual(inspector.object_name, '["a\\", (b"]')
+        inspector = agent.claim(')' + "(", qassure.Severity.WARNING)
+        self.assertEqual(inspector.object_name, """[')' + "("]""")
 
 
 class TestInspector(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.agent = helpers.BaseAuditor()
+
     def setUp(self):
-        self.agent = helpers.BaseAuditor()
+        # Every test shares one auditor, so start each of them from an empty report
+        self.agent.report.clear()
+        self.agent.is_blocked = False
 
     def test_report_deficiency(self):
         inspector = self.agent.claim("test", qassure.Severity.BLOCKER)
@@ -106,102 +244,57 @@ class TestInspector(unittest.TestCase):
         self.assertEqual(self.agent.report[3][1], "test message4")
 
     def assertIsDeficiency(self, call, *args):
-        before_count = len(self.agent.report)
+        # Holding on to the report also catches a claim that replaces it rather than appending to it
+        report = self.agent.report
+        before_count = len(report)
         call(*args)
-        self.assertEqual(len(self.agent.report), before_count + 1)
+        self.assertIs(self.agent.report, report)
+        self.assertEqual(len(report), before_count + 1)
 
     def assertIsNotDeficiency(self, call, *args):
-        before_count = len(self.agent.report)
+        report = self.agent.report
+        before_count = len(report)
         call(*args)
-        self.assertEqual(len(self.agent.report), before_count)
+        self.assertIs(self.agent.report, report)
+        self.assertEqual(len(report), before_count)
+
+    def assertClaimCases(self, claim_method, cases):
+        for value, *args, is_deficiency in cases:
+            with self.subTest(claim_method, value=value, args=args):
+                assertion = self.assertIsDeficiency if is_deficiency else self.assertIsNotDeficiency
+                assertion(getattr(self.agent.claim(value), claim_method), *args)
+
+    def test_stored_inspector_source(self):
+        inspector = self.agent.claim(None)
+        inspector.is_truthy()
+        inspector.is_not_none()
+        inspector.is_truthy().is_type(int)
+        self.assertEqual(len(self.agent.report), 4)
+        self.assertIn("inspector.is_truthy()", self.agent.report[0].source)
+        self.assertIn("inspector.is_not_none()", self.agent.report[1].source)
+        self.assertNotEqual(self.agent.report[0].source, self.agent.report[1].source)
+        self.assertEqual(self.agent.report[2].source, self.agent.report[3].source)
 
     def test_is_none(self):
         self.assertIsDeficiency(self.agent.claim("foo").is_none, "test message")
         self.assertEqual(self.agent.report[-1][1], "test message")
-        self.assertIsNotDeficiency(self.agent.claim(None).is_none)
-        self.assertIsDeficiency(self.agent.claim("").is_none)
-        self.assertIsDeficiency(self.agent.claim(0).is_none)
-        self.assertIsDeficiency(self.agent.claim(5).is_none)
-        self.assertIsDeficiency(self.agent.claim(False).is_none)
-        self.assertIsDeficiency(self.agent.claim(True).is_none)
+        self.assertClaimCases("is_none", IS_NONE_CASES)
 
     def test_is_not_none(self):
-        self.assertIsNotDeficiency(self.agent.claim("foo").is_not_none)
         self.assertIsDeficiency(self.agent.claim(None).is_not_none, "test message2")
         self.assertEqual(self.agent.report[-1][1], "test message2")
-        self.assertIsNotDeficiency(self.agent.claim("").is_not_none)
-        self.assertIsNotDeficiency(self.agent.claim(0).is_not_none)
-        self.assertIsNotDeficiency(self.agent.claim(5).is_not_none)
-        self.assertIsNotDeficiency(self.agent.claim(False).is_not_none)
-        self.assertIsNotDeficiency(self.agent.claim(True).is_not_none)
+        self.assertClaimCases("is_not_none", IS_NOT_NONE_CASES)
 
     def test_is_truthy(self):
-        self.assertIsNotDeficiency(self.agent.claim(True).is_truthy)
-        self.assertIsDeficiency(self.agent.claim(False).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(5).is_truthy)
-        self.assertIsDeficiency(self.agent.claim(0).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(-5).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(1).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(-1).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim("abcde").is_truthy)
-        self.assertIsDeficiency(self.agent.claim(range(0)).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(range(0, 5)).is_truthy)
-        self.assertIsDeficiency(self.agent.claim("").is_truthy)
-        self.assertIsDeficiency(self.agent.claim(None).is_truthy)
-        self.assertIsDeficiency(self.agent.claim(0.0).is_truthy)
-        self.assertIsDeficiency(self.agent.claim(0.0j).is_truthy)
-        self.assertIsDeficiency(self.agent.claim([]).is_truthy)
-        self.assertIsDeficiency(self.agent.claim({}).is_truthy)
-        self.assertIsDeficiency(self.agent.claim(tuple()).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim([0]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(["0"]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(["False"]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(["abcd"]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(["None"]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim([False]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim([None]).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim({0}).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim({False}).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim({None}).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim((0,)).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim((False,)).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim((None,)).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim({"a", "c", "d"}).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim({"0": False}).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim({"a": "a", "c": "b", "d": "f"}).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim((0,)).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim((1, 2, 3)).is_truthy)
-        self.assertIsDeficiency(self.agent.claim(helpers.TruthyClass(False)).is_truthy)
-        self.assertIsNotDeficiency(self.agent.claim(helpers.TruthyClass(True)).is_truthy)
+        self.assertClaimCases("is_truthy", IS_TRUTHY_CASES)
 
     def test_is_type(self):
-        self.assertIsNotDeficiency(self.agent.claim("five").is_type, str)
-        self.assertIsNotDeficiency(self.agent.claim(5).is_type, int)
-        self.assertIsNotDeficiency(self.agent.claim(True).is_type, bool)
         self.assertIsNotDeficiency(self.agent.claim(self).is_type, self.__class__)
-        self.assertIsNotDeficiency(self.agent.claim(4.3).is_type, float)
-        self.assertIsNotDeficiency(self.agent.claim([]).is_type, list)
-        self.assertIsNotDeficiency(self.agent.claim(["a", "b", 4]).is_type, list)
-        self.assertIsNotDeficiency(self.agent.claim({"a", "b"}).is_type, set)
-        self.assertIsNotDeficiency(self.agent.claim({"a": "c", "b": "d"}).is_type, dict)
-        self.assertIsNotDeficiency(self.agent.claim(("a",)).is_type, tuple)
         self.assertIsNotDeficiency(self.agent.claim(self).is_type, unittest.TestCase)
-        self.assertIsDeficiency(self.agent.claim("5").is_type, int)
-        self.assertIsDeficiency(self.agent.claim(0).is_type, bool)
+        self.assertClaimCases("is_type", IS_TYPE_CASES)
 
     def test_is_callable(self):
-        self.assertIsNotDeficiency(self.agent.claim(TestAgent).is_callable)
-        self.assertIsNotDeficiency(self.agent.claim(TestAgent.assertEqual).is_callable)
-        self.assertIsNotDeficiency(self.agent.claim(helpers.function_example).is_callable)
-        self.assertIsNotDeficiency(self.agent.claim(lambda: "hello world").is_callable)
-        self.assertIsDeficiency(self.agent.claim("hello world").is_callable)
-        self.assertIsDeficiency(self.agent.claim(5).is_callable)
-        self.assertIsDeficiency(self.agent.claim(False).is_callable)
-        self.assertIsDeficiency(self.agent.claim(None).is_callable)
-        self.assertIsDeficiency(self.agent.claim(2.32).is_callable)
-        self.assertIsNotDeficiency(self.agent.claim(helpers.TruthyClass).is_callable)
-        self.assertIsDeficiency(self.agent.claim(helpers.TruthyClass("huh")).is_callable)
-        self.assertIsNotDeficiency(self.agent.claim(helpers.CallableClass()).is_callable)
+        self.assertClaimCases("is_callable", IS_CALLABLE_CASES)
 
     def test_is_equal_to(self):
         self.assertIsNotDeficiency(self.agent.claim(5).is_equal_to, 5)
@@ -225,6 +318,58 @@ class TestInspector(unittest.TestCase):
         self.assertIsDeficiency(self.agent.claim([1, 1, 1, 1, 2]).contains, "one")
         self.assertIsDeficiency(self.agent.claim([]).contains, "one")
 
+    def test_all_equal_to(self):
+        self.assertIsNotDeficiency(self.agent.claim([5, 5, 5]).all_equal_to, 5)
+        self.assertIsNotDeficiency(self.agent.claim([]).all_equal_to, 5)
+        self.assertIsDeficiency(self.agent.claim([5, 4, 5]).all_equal_to, 5)
+        self.assertIn("index 1", self.agent.report[-1][1])
+        self.assertIsDeficiency(self.agent.claim(("a", "b")).all_equal_to, "a")
+
+    def test_all_in_range(self):
+        self.assertIsNotDeficiency(self.agent.claim([1, 2, 3]).all_in_range, 1, 3)
+        self.assertIsNotDeficiency(self.agent.claim([]).all_in_range, 1, 3)
+        self.assertIsDeficiency(self.agent.claim([1, 2, 4]).all_in_range, 1, 3)
+        self.assertIn("index 2", self.agent.report[-1][1])
+        self.assertIsDeficiency(self.agent.claim([0.5, 2]).all_in_range, 1, 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_bulk_arrays(self):
+        self.assertIsNotDeficiency(self.agent.claim(np.full(1000, 7)).all_equal_to, 7)
+        values = np.full(1000, 7.0)
+        values[500] = 6.5
+        self.assertIsDeficiency(self.agent.claim(values).all_equal_to, 7)
+        self.assertIn("index 500", self.agent.report[-1][1])
+        self.assertIsNotDeficiency(self.agent.claim(np.arange(10)).all_in_range, 0, 9)
+        self.assertIsDeficiency(self.agent.claim(np.arange(10)).all_in_range, 0, 8)
+        self.assertIn("index 9", self.agent.report[-1][1])
+        self.assertIsDeficiency(self.agent.claim(np.arange(6).reshape(2, 3)).all_in_range, 0, 4)
+        self.assertIn("index (1, 2)", self.agent.report[-1][1])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_bulk_arrays_outside_kernel_types(self):
+        self.assertIsNotDeficiency(self.agent.claim(np.full(10, 0.5)).all_equal_to, fractions.Fraction(1, 2))
+        self.assertIsDeficiency(self.agent.claim(np.arange(10)).all_in_range, fractions.Fraction(1, 2), 9)
+        self.assertIn("index 0", self.agent.report[-1][1])
+        self.assertIsDeficiency(self.agent.claim(np.arange(10)).all_equal_to, 2 ** 70)
+        self.assertIsNotDeficiency(self.agent.claim(np.arange(10)).all_in_range, -2 ** 70, 2 ** 70)
+        self.assertIsNotDeficiency(self.agent.claim(np.ones(10, dtype=np.float16)).all_equal_to, 1)
+        self.assertIsDeficiency(self.agent.claim(np.arange(10, dtype=np.longdouble)).all_in_range, 0, 8)
+        self.assertIn("index 9", self.agent.report[-1][1])
+        large = np.array([2 ** 63 + 10], dtype=np.uint64)
+        self.assertIsDeficiency(self.agent.claim(large).all_in_range, 0, 2 ** 63 - 1)
+        self.assertIsDeficiency(self.agent.claim(np.array([2 ** 53 + 1], dtype=np.uint64)).all_equal_to, 2 ** 53)
+        self.assertIsNotDeficiency(self.agent.claim(large).all_equal_to, np.uint64(2 ** 63 + 10))
+        self.assertIsDeficiency(self.agent.claim(np.array([2 ** 53 + 1])).all_equal_to, np.uint64(2 ** 53))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_import_does_not_load_numpy(self):
+        code = "import sys; sys.path.insert(0, sys.argv[1]); import qassure; print('numpy' in sys.modules)"
+        source_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+        result = subprocess.run([sys.executable, "-c", code, source_path], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
     def test_raises(self):
         self.assertIsDeficiency(self.agent.claim(int).raises, ValueError, "1")
         self.assertIsNotDeficiency(self.agent.claim(int).raises, ValueError, "one")
+        inspector = self.agent.claim(int, qassure.Severity.BLOCKER)
+        self.assertRaises(qassure.framework.BlockingDeficiencyError, inspector.raises, Exception, "1")